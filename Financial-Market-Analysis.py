@@ -8,6 +8,8 @@ import numpy as np # type: ignore
 import matplotlib.dates as mdates # type: ignore
 from matplotlib.widgets import Cursor # type: ignore
 import datetime
+import os
+from symbol_search import load_symbol_directory, build_symbol_index, search_symbols
 
 # --- Initialize main window ---
 root = tk.Tk()
@@ -77,15 +79,115 @@ ttk.Label(sidebar_header, text="Dashboard Controls", style="Sidebar.Heading.TLab
 symbol_frame = ttk.Frame(left_sidebar, padding=(10, 5, 10, 5), style="Sidebar.TFrame")
 symbol_frame.pack(fill=tk.X)
 
-ttk.Label(symbol_frame, text="Select Stock Symbol:", style="Sidebar.TLabel").pack(anchor='w')
+ttk.Label(symbol_frame, text="Search Stock Symbol:", style="Sidebar.TLabel").pack(anchor='w')
 
-# Stock symbols list
+# Fallback stock symbols list (used when symbols.csv is missing)
 stock_symbols = ["BMW.DE", "VOW3.DE", "MBG.DE", "P911.DE", "RACE", "AML.L", "LCID", "RIVN", "MCD", "KO", "NVDA", "NFLX", "TSLA", "META", "GOOGL", "AMZN", "AAPL", "ADANIENT.NS", "WIPRO.NS", "TATAMOTORS.NS", "HINDUNILVR.NS", "SBIN.NS", "ICICIBANK.NS", "HDFCBANK.NS", "INFY.NS", "TCS.NS", "RELIANCE.NS"]
+
+# Symbol directory file: one row per ticker with columns ticker,name,exchange,currency
+symbol_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "symbols.csv")
+
+# Currency codes mapped to the prefix shown in KPI cards and tooltips
+currency_symbols = {"INR": "₹", "USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥", "CHF": "CHF "}
+
+def format_symbol_entry(entry):
+    # Dropdown text: ticker followed by company name and exchange
+    details = entry["name"]
+    if entry["exchange"]:
+        details = f"{details} ({entry['exchange']})" if details else entry["exchange"]
+    return f"{entry['ticker']} - {details}" if details else entry["ticker"]
+
+symbol_index = build_symbol_index(load_symbol_directory(symbol_file, stock_symbols))
 symbol_var = tk.StringVar()
-symbol_combo = ttk.Combobox(symbol_frame, textvariable=symbol_var, values=stock_symbols, width=15, state="readonly")
+symbol_combo = ttk.Combobox(symbol_frame, textvariable=symbol_var, width=15,
+                            values=[format_symbol_entry(e) for e in search_symbols(symbol_index, "")])
 symbol_combo.pack(fill=tk.X, pady=(5, 0))
 
-fetch_button = ttk.Button(symbol_frame, text="Fetch Data", command=lambda: fetch_stock_data(symbol_var.get()))
+search_job = None  # Pending debounced search callback
+last_symbol_query = ""  # Entry text the dropdown values were last filtered for
+
+def set_symbol_text(text):
+    # Programmatic entry updates should not count as typing
+    global last_symbol_query
+    symbol_var.set(text)
+    last_symbol_query = text
+    symbol_combo.icursor(tk.END)
+
+def refresh_symbol_matches(open_list=True):
+    global search_job, last_symbol_query
+    search_job = None
+    last_symbol_query = symbol_var.get()
+    matches = search_symbols(symbol_index, last_symbol_query)
+    symbol_combo.config(values=[format_symbol_entry(e) for e in matches])
+
+    # Show the filtered list while the user is typing in the entry
+    if open_list and matches and str(symbol_combo.tk.call("focus")) == str(symbol_combo):
+        symbol_combo.event_generate("<Down>")
+
+def schedule_symbol_search():
+    global search_job
+    if search_job is not None:
+        root.after_cancel(search_job)
+    search_job = root.after(150, refresh_symbol_matches)
+
+def on_symbol_typed(_):
+    # Only edits re-filter the list; cursor and modifier keys leave the text unchanged
+    if symbol_var.get() != last_symbol_query:
+        schedule_symbol_search()
+
+def on_symbol_down(_):
+    # Filter right away so Down never opens a stale list
+    if search_job is not None:
+        root.after_cancel(search_job)
+        refresh_symbol_matches(open_list=False)
+
+def on_popdown_key(keysym, char):
+    # The open list takes keyboard focus; send typed text back to the entry
+    if keysym != "BackSpace" and not (char and char.isprintable()):
+        return ""
+    symbol_combo.tk.call("ttk::combobox::Unpost", symbol_combo)
+    symbol_combo.focus_set()
+    if keysym == "BackSpace":
+        pos = symbol_combo.index(tk.INSERT)
+        if pos > 0:
+            symbol_combo.delete(pos - 1)
+    else:
+        symbol_combo.insert(tk.INSERT, char)
+    on_symbol_typed(None)
+    return "break"
+
+symbol_popdown = symbol_combo.tk.call("ttk::combobox::PopdownWindow", symbol_combo)
+symbol_combo.tk.call("bind", f"{symbol_popdown}.f.l", "<KeyPress>",
+                     f'if {{[{root.register(on_popdown_key)} %K %A] eq "break"}} break')
+
+def on_symbol_selected(_):
+    # Keep only the ticker in the entry once a match is picked
+    set_symbol_text(symbol_var.get().split(" - ")[0])
+
+def resolve_symbol(text):
+    # Dropdown entries ("TICKER - name") and ticker-like text are used as typed;
+    # only text that reads like a company name is replaced by the top search hit
+    text = text.strip()
+    if " - " in text:
+        return text.split(" - ")[0].upper().strip()
+    ticker = text.upper()
+    if (text == ticker and " " not in text) or ticker in symbol_index["by_ticker"]:
+        return ticker
+    matches = search_symbols(symbol_index, text, limit=1)
+    return matches[0]["ticker"] if matches else ticker
+
+def fetch_selected_symbol():
+    # Resolve typed company names to a ticker before fetching
+    ticker = resolve_symbol(symbol_var.get())
+    set_symbol_text(ticker)
+    fetch_stock_data(ticker)
+
+symbol_combo.bind("<KeyRelease>", on_symbol_typed)
+symbol_combo.bind("<Down>", on_symbol_down)
+symbol_combo.bind("<<ComboboxSelected>>", on_symbol_selected)
+symbol_combo.bind("<Return>", lambda _: fetch_selected_symbol())
+
+fetch_button = ttk.Button(symbol_frame, text="Fetch Data", command=fetch_selected_symbol)
 fetch_button.pack(fill=tk.X, pady=10)
 
 # --- View Selection Radiobuttons ---
@@ -154,8 +256,9 @@ tips_frame.pack(fill=tk.X)
 
 ttk.Label(tips_frame, text="Interactive Features:", style="Sidebar.TLabel").pack(anchor='w')
 
-tips = tk.Text(tips_frame, height=4, width=30, bg='#F0F8FF', fg=text_color, wrap=tk.WORD)
+tips = tk.Text(tips_frame, height=5, width=30, bg='#F0F8FF', fg=text_color, wrap=tk.WORD)
 tips.pack(fill=tk.X, pady=5)
+tips.insert(tk.END, "• Type a ticker or company name to search symbols\n")
 tips.insert(tk.END, "• Hover over any graph to see detailed data\n")
 tips.insert(tk.END, "• Data values appear in the tooltip area\n")
 tips.insert(tk.END, "• Switch between views to see different visualizations\n")
@@ -221,6 +324,7 @@ graph_frame.pack(fill=tk.BOTH, expand=True)
 # --- Global variables ---
 hover_lines = []  # List to store vertical and horizontal lines for tooltips
 stock_data = None  # Global variable to store current stock data
+currency_prefix = ""  # Currency prefix for prices of the current stock
 annotations = []   # List to store data point annotations
 
 # Store graph titles for each view
@@ -241,8 +345,8 @@ graph_titles = {
 
 # --- Function to fetch real-time data ---
 def fetch_stock_data(symbol):
-    global stock_data
-    symbol = symbol.upper().strip()
+    global stock_data, currency_prefix
+    symbol = symbol.split(" - ")[0].upper().strip()
     if not symbol:
         messagebox.showerror("Error", "Please select a stock symbol!")
         return
@@ -259,10 +363,18 @@ def fetch_stock_data(symbol):
         # Store data globally for tooltips
         stock_data = df
 
-        # Update KPI values with rupee symbol
-        kpi_close.config(text=f"₹{df['Close'].iloc[-1]:.2f}")
-        kpi_high.config(text=f"₹{df['High'].max():.2f}")
-        kpi_low.config(text=f"₹{df['Low'].min():.2f}")
+        # Update KPI values with the listing currency from the symbol directory
+        currency = symbol_index["by_ticker"].get(symbol, {}).get("currency", "")
+        if not currency:
+            # Not in the directory (or no currency listed): ask yfinance instead
+            try:
+                currency = stock.fast_info["currency"] or ""
+            except Exception:
+                currency = ""
+        currency_prefix = currency_symbols.get(currency, f"{currency} " if currency else "")
+        kpi_close.config(text=f"{currency_prefix}{df['Close'].iloc[-1]:.2f}")
+        kpi_high.config(text=f"{currency_prefix}{df['High'].max():.2f}")
+        kpi_low.config(text=f"{currency_prefix}{df['Low'].min():.2f}")
 
         # Update the charts
         update_graphs(df, symbol)
@@ -467,7 +579,7 @@ def hover(event):
             closest_date_idx = min(range(len(dates)), key=lambda i: abs(mdates.date2num(dates[i]) - x))
             closest_date = dates[closest_date_idx]
             ma_value = stock_data['Close'].rolling(window=7).mean()[closest_date]
-            tooltip_text = f"Date: {closest_date.strftime('%Y-%m-%d')}\nMA(7): ₹{ma_value:.2f}"
+            tooltip_text = f"Date: {closest_date.strftime('%Y-%m-%d')}\nMA(7): {currency_prefix}{ma_value:.2f}"
             
         elif current_ax == (0, 1):  # Volume Traded
             # Find closest date point
@@ -484,7 +596,7 @@ def hover(event):
             closest_date = dates[closest_date_idx]
             close = stock_data['Close'][closest_date]
             change = stock_data['Close'].pct_change()[closest_date] * 100 if closest_date_idx > 0 else 0
-            tooltip_text = f"Date: {closest_date.strftime('%Y-%m-%d')}\nClose: ₹{close:.2f}\nChange: {change:.2f}%"
+            tooltip_text = f"Date: {closest_date.strftime('%Y-%m-%d')}\nClose: {currency_prefix}{close:.2f}\nChange: {change:.2f}%"
             
         elif current_ax == (1, 1):  # Monthly Volume Change
             monthly_volume = stock_data['Volume'].resample('M').sum()
@@ -509,7 +621,7 @@ def hover(event):
             closest_date = dates[closest_date_idx]
             high = stock_data['High'][closest_date]
             low = stock_data['Low'][closest_date]
-            tooltip_text = f"Date: {closest_date.strftime('%Y-%m-%d')}\nHigh: ₹{high:.2f}\nLow: ₹{low:.2f}"
+            tooltip_text = f"Date: {closest_date.strftime('%Y-%m-%d')}\nHigh: {currency_prefix}{high:.2f}\nLow: {currency_prefix}{low:.2f}"
             
         elif current_ax == (0, 1):  # Distribution of Daily Returns
             tooltip_text = f"Return: {x:.2f}%\nFrequency: {y:.0f}"
@@ -523,7 +635,7 @@ def hover(event):
             if year in year_values:
                 year_idx = list(year_values).index(year)
                 value = yearly_sales.iloc[year_idx]
-                tooltip_text = f"Year: {year}\nTotal: ₹{value:.2f}"
+                tooltip_text = f"Year: {year}\nTotal: {currency_prefix}{value:.2f}"
             else:
                 tooltip_text = "No data available"
                 
@@ -0,0 +1,200 @@
+import os
+import csv
+import bisect
+import random
+import string
+import time
+from collections import Counter
+import numpy as np # type: ignore
+
+# --- Symbol directory and type-ahead search index ---
+# Kept out of Financial-Market-Analysis.py so the index can be built and
+# checked without opening the dashboard window: python symbol_search.py
+
+max_search_results = 50  # Number of matches shown in the search dropdown
+
+# Company name suffixes shared by too many listings to help fuzzy matching
+generic_name_words = {"limited", "ltd", "inc", "corp", "corporation", "company", "co", "plc", "ag", "se",
+                      "sa", "nv", "n.v", "group", "holdings", "holding", "the", "and", "&"}
+
+def load_symbol_directory(path, fallback_symbols=()):
+    # Read the symbol directory, falling back to the bare ticker list
+    if not os.path.exists(path):
+        return [{"ticker": s, "name": "", "exchange": "", "currency": ""} for s in fallback_symbols]
+
+    entries = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            ticker = (row.get("ticker") or "").strip().upper()
+            if not ticker:
+                continue
+            entries.append({
+                "ticker": ticker,
+                "name": (row.get("name") or "").strip(),
+                "exchange": (row.get("exchange") or "").strip(),
+                "currency": (row.get("currency") or "").strip()
+            })
+    return entries
+
+def symbol_ngrams(text, n=3):
+    # Character n-grams of a space-padded string, so short queries still produce grams
+    padded = f" {text} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+def name_words(name):
+    return name.lower().replace(",", " ").split()
+
+def build_symbol_index(entries):
+    # Sorted (key, entry id) arrays for prefix lookup via bisect
+    ticker_pairs = sorted((e["ticker"].lower(), i) for i, e in enumerate(entries))
+    name_pairs = set()
+    for i, e in enumerate(entries):
+        name = e["name"].lower()
+        if name:
+            name_pairs.add((name, i))
+            for word in name_words(name):
+                name_pairs.add((word, i))
+    name_pairs = sorted(name_pairs)
+
+    # Fuzzy lookup works on distinct words (tickers and name words other than
+    # generic suffixes): trigrams point at words, words point at entries, so a
+    # word shared by thousands of listings is still a single posting per gram
+    word_ids = {}
+    word_entries = []
+    for i, e in enumerate(entries):
+        words = {e["ticker"].lower()}
+        words.update(w for w in name_words(e["name"]) if w.strip(".") not in generic_name_words)
+        for word in words:
+            if word not in word_ids:
+                word_ids[word] = len(word_entries)
+                word_entries.append([])
+            word_entries[word_ids[word]].append(i)
+
+    # Fuzzy scores are kept in ticker order, so word postings hold ticker ranks
+    ticker_rank = np.empty(len(entries), dtype=np.int64)
+    ticker_rank[[i for _, i in ticker_pairs]] = np.arange(len(entries))
+    word_entries = [np.sort(ticker_rank[ids]) for ids in word_entries]
+
+    word_grams = {}
+    word_gram_counts = [0] * len(word_entries)
+    for word, w in word_ids.items():
+        grams = symbol_ngrams(word)
+        word_gram_counts[w] = len(grams)
+        for gram in grams:
+            word_grams.setdefault(gram, []).append(w)
+
+    return {
+        "entries": entries,
+        "by_ticker": {e["ticker"]: e for e in entries},
+        "ticker_keys": [k for k, _ in ticker_pairs],
+        "ticker_ids": [i for _, i in ticker_pairs],
+        "ticker_rank": ticker_rank,
+        "ranked_ids": np.array([i for _, i in ticker_pairs], dtype=np.int64),
+        "name_keys": [k for k, _ in name_pairs],
+        "name_ids": [i for _, i in name_pairs],
+        "word_entries": word_entries,
+        "word_grams": word_grams,
+        "word_gram_counts": word_gram_counts
+    }
+
+def prefix_matches(keys, ids, prefix):
+    # All entry ids whose key starts with prefix, in sorted key order
+    lo = bisect.bisect_left(keys, prefix)
+    hi = bisect.bisect_left(keys, prefix + "\uffff", lo)
+    return ids[lo:hi]
+
+def fuzzy_word_scores(index, query_word):
+    # Best trigram similarity between query_word and each entry's words, by ticker rank
+    query_grams = symbol_ngrams(query_word)
+    hits = Counter()
+    for gram in query_grams:
+        hits.update(index["word_grams"].get(gram, ()))
+
+    min_hits = max(1, (len(query_grams) + 1) // 2)
+    scores = np.zeros(len(index["entries"]))
+    for w, h in hits.items():
+        if h < min_hits:
+            continue
+        similarity = h / (len(query_grams) + index["word_gram_counts"][w] - h)
+        ids = index["word_entries"][w]
+        scores[ids] = np.maximum(scores[ids], similarity)
+    return scores
+
+def search_symbols(index, query, limit=max_search_results):
+    query = query.strip().lower()
+    if not query:
+        return [index["entries"][i] for i in index["ticker_ids"][:limit]]
+
+    # Ticker prefixes rank first, then company name prefixes
+    found = []
+    seen = set()
+    for i in prefix_matches(index["ticker_keys"], index["ticker_ids"], query) + \
+             prefix_matches(index["name_keys"], index["name_ids"], query):
+        if i not in seen:
+            seen.add(i)
+            found.append(i)
+            if len(found) >= limit:
+                break
+
+    # Top up with fuzzy matches, summing each query word's best word similarity
+    if len(found) < limit:
+        # Candidates come out in ticker order; keep those tied with or above the
+        # last needed score, then a stable sort by score keeps ticker order in ties
+        need = limit - len(found)
+        scores = sum(fuzzy_word_scores(index, word) for word in query.split())
+        scores[index["ticker_rank"][list(seen)]] = 0
+        candidates = np.flatnonzero(scores)
+        candidate_scores = scores[candidates]
+        if len(candidates) > need:
+            cutoff = np.partition(candidate_scores, len(candidates) - need)[len(candidates) - need]
+            keep = candidate_scores >= cutoff
+            candidates, candidate_scores = candidates[keep], candidate_scores[keep]
+        order = np.argsort(-candidate_scores, kind="stable")[:need]
+        found.extend(index["ranked_ids"][candidates[order]].tolist())
+
+    return [index["entries"][i] for i in found]
+
+# --- Self-check on a generated large directory ---
+if __name__ == "__main__":
+    random.seed(26)
+    sectors = ["Systems", "Energy", "Power", "Bank", "Motors", "Industries", "Pharma", "Technologies", "Steel",
+               "Finance", "Capital", "Solar", "Chemicals", "Foods", "Insurance", "Realty", "Cement", "Airlines",
+               "Software", "Semiconductor", "Health", "Networks", "Mining", "Logistics"]
+    suffixes = ["Limited", "Inc.", "Holdings", "Corporation", "AG", "plc", "Ltd", "SE"]
+
+    def random_word():
+        return "".join(random.choices(string.ascii_lowercase, k=random.randint(4, 8))).capitalize()
+
+    def random_ticker():
+        return "".join(random.choices(string.ascii_uppercase, k=random.randint(2, 6))) + random.choice(["", ".NS", ".DE"])
+
+    entries = [{"ticker": random_ticker(),
+                "name": f"{random_word()} {random.choice(sectors)} {random.choice(sectors + [random_word()])} {random.choice(suffixes)}",
+                "exchange": "", "currency": ""} for _ in range(20000)]
+    entries.append({"ticker": "NVDA", "name": "NVIDIA Corporation", "exchange": "NASDAQ", "currency": "USD"})
+
+    start = time.perf_counter()
+    index = build_symbol_index(entries)
+    print(f"Indexed {len(entries)} symbols in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    # Query, word the names of the top results must contain, number of top results checked
+    checks = [("systms", "systems", 5), ("sytems", "systems", 5), ("pharam", "pharma", 5),
+              ("semicondutor", "semiconductor", 5), ("ene pow", "energy", 5), ("nvidai", "nvidia", 1),
+              ("nvda", "nvidia", 1)]
+    for query, expected, top in checks:
+        results = search_symbols(index, query)[:top]
+        assert len(results) == top and all(expected in name_words(e["name"]) for e in results), \
+            (query, [e["name"] for e in results])
+    assert "power" in name_words(search_symbols(index, "ene pow")[0]["name"])
+
+    queries = [q for q, _, _ in checks] + ["limted", "holdngs ltd", "a", "zz", "bank", "tata motors", "xyzzy"]
+    worst = 0.0
+    for query in queries:
+        start = time.perf_counter()
+        for _ in range(20):
+            search_symbols(index, query)
+        elapsed = (time.perf_counter() - start) / 20 * 1000
+        worst = max(worst, elapsed)
+        print(f"{query!r:16} {elapsed:.3f} ms")
+    assert worst < 1.0, f"slowest lookup took {worst:.3f} ms"
+    print("Symbol search check passed")